@@ -1,7 +1,10 @@
 """Furniture Sales Agent using OpenAI Agents SDK."""
 
+from typing_extensions import TypedDict
+
 from agents import Agent, function_tool
 from furniture_catalog import (
+    _norm_id,
     get_all_categories,
     get_items_by_category,
     get_item_by_id,
@@ -10,15 +13,46 @@ from furniture_catalog import (
     format_item_details,
 )
 
-# Shopping cart to track items
-shopping_cart: list[dict] = []
+# Shopping cart to track items, keyed by product ID for O(1) add/remove
+shopping_cart: dict[str, dict] = {}
+
+
+def _format_item_line(item) -> str:
+    """Format a one-line listing entry for an item."""
+    return f"- **{item.name}** (ID: {item.id}) - ${item.price:.2f} - {item.stock_str}"
+
+
+# The catalog never mutates, so the listing strings the browse/detail tools
+# return are precomputed once at import instead of rebuilt per tool call.
+_CATEGORIES_BANNER = (
+    f"Available furniture categories: "
+    f"{', '.join(cat.title() for cat in get_all_categories())}"
+)
+_CATEGORY_LISTINGS: dict[str, str] = {
+    category: (
+        f"**{category.title()}** ({len(items)} items):\n\n"
+        + "\n".join(_format_item_line(item) for item in items)
+        + "\n"
+    )
+    for category in get_all_categories()
+    for items in [get_items_by_category(category)]
+}
+_ITEM_DETAILS: dict[str, str] = {
+    item.id: format_item_details(item)
+    for category in get_all_categories()
+    for item in get_items_by_category(category)
+}
+
+# Miss/empty messages built once; the category list stays in sync with
+# the catalog instead of being spelled out by hand.
+_CAT_MISS_MSG = f"Available categories: {', '.join(get_all_categories())}"
+_EMPTY_CART_MSG = "Your shopping cart is empty."
 
 
 @function_tool
 def browse_categories() -> str:
     """Browse all available furniture categories."""
-    categories = get_all_categories()
-    return f"Available furniture categories: {', '.join(cat.title() for cat in categories)}"
+    return _CATEGORIES_BANNER
 
 
 @function_tool
@@ -28,15 +62,10 @@ def browse_category(category: str) -> str:
     Args:
         category: The furniture category to browse (e.g., sofas, chairs, tables, beds, storage)
     """
-    items = get_items_by_category(category)
-    if not items:
-        return f"No items found in category '{category}'. Available categories: sofas, chairs, tables, beds, storage"
-
-    result = f"**{category.title()}** ({len(items)} items):\n\n"
-    for item in items:
-        stock = "In Stock" if item["in_stock"] else "Out of Stock"
-        result += f"- **{item['name']}** (ID: {item['id']}) - ${item['price']:.2f} - {stock}\n"
-    return result
+    listing = _CATEGORY_LISTINGS.get(category.lower())
+    if not listing:
+        return f"No items found in category '{category}'. {_CAT_MISS_MSG}"
+    return listing
 
 
 @function_tool
@@ -46,10 +75,10 @@ def get_product_details(product_id: str) -> str:
     Args:
         product_id: The product ID (e.g., SF001, CH002, TB001)
     """
-    item = get_item_by_id(product_id)
-    if not item:
+    details = _ITEM_DETAILS.get(_norm_id(product_id))
+    if not details:
         return f"Product with ID '{product_id}' not found. Please check the ID and try again."
-    return format_item_details(item)
+    return details
 
 
 @function_tool
@@ -63,11 +92,8 @@ def search_furniture(query: str) -> str:
     if not items:
         return f"No items found matching '{query}'. Try different keywords."
 
-    result = f"**Search results for '{query}'** ({len(items)} items):\n\n"
-    for item in items:
-        stock = "In Stock" if item["in_stock"] else "Out of Stock"
-        result += f"- **{item['name']}** (ID: {item['id']}) - ${item['price']:.2f} - {stock}\n"
-    return result
+    header = f"**Search results for '{query}'** ({len(items)} items):\n\n"
+    return header + "\n".join(_format_item_line(item) for item in items)
 
 
 @function_tool
@@ -82,11 +108,8 @@ def filter_by_price(min_price: float, max_price: float) -> str:
     if not items:
         return f"No items found in the price range ${min_price:.2f} - ${max_price:.2f}."
 
-    result = f"**Items between ${min_price:.2f} - ${max_price:.2f}** ({len(items)} items):\n\n"
-    for item in items:
-        stock = "In Stock" if item["in_stock"] else "Out of Stock"
-        result += f"- **{item['name']}** (ID: {item['id']}) - ${item['price']:.2f} - {stock}\n"
-    return result
+    header = f"**Items between ${min_price:.2f} - ${max_price:.2f}** ({len(items)} items):\n\n"
+    return header + "\n".join(_format_item_line(item) for item in items)
 
 
 @function_tool
@@ -101,39 +124,83 @@ def add_to_cart(product_id: str, quantity: int = 1) -> str:
     if not item:
         return f"Product with ID '{product_id}' not found."
 
-    if not item["in_stock"]:
-        return f"Sorry, **{item['name']}** is currently out of stock."
+    if not item.in_stock:
+        return f"Sorry, **{item.name}** is currently out of stock."
 
     # Check if item already in cart
-    for cart_item in shopping_cart:
-        if cart_item["id"] == item["id"]:
+    cart_item = shopping_cart.get(item.id)
+    if cart_item:
+        cart_item["quantity"] += quantity
+        return f"Updated quantity of **{item.name}** to {cart_item['quantity']} in your cart."
+
+    shopping_cart[item.id] = {
+        "id": item.id,
+        "name": item.name,
+        "price": item.price,
+        "quantity": quantity
+    }
+    return f"Added {quantity}x **{item.name}** (${item.price:.2f}) to your cart."
+
+
+class CartItemRequest(TypedDict):
+    """One product/quantity pair for a batched cart addition."""
+
+    product_id: str
+    quantity: int
+
+
+@function_tool
+def add_items_to_cart(items: list[CartItemRequest]) -> str:
+    """Add several products to the shopping cart in a single call.
+
+    Args:
+        items: Products to add, each with a product_id and quantity
+    """
+    lines = []
+    for entry in items:
+        product_id = entry["product_id"]
+        quantity = entry.get("quantity", 1)
+        item = get_item_by_id(product_id)
+        if not item:
+            lines.append(f"Product with ID '{product_id}' not found.")
+            continue
+        if not item.in_stock:
+            lines.append(f"Sorry, **{item.name}** is currently out of stock.")
+            continue
+
+        cart_item = shopping_cart.get(item.id)
+        if cart_item:
             cart_item["quantity"] += quantity
-            return f"Updated quantity of **{item['name']}** to {cart_item['quantity']} in your cart."
+            lines.append(f"Updated quantity of **{item.name}** to {cart_item['quantity']} in your cart.")
+        else:
+            shopping_cart[item.id] = {
+                "id": item.id,
+                "name": item.name,
+                "price": item.price,
+                "quantity": quantity
+            }
+            lines.append(f"Added {quantity}x **{item.name}** (${item.price:.2f}) to your cart.")
 
-    shopping_cart.append({
-        "id": item["id"],
-        "name": item["name"],
-        "price": item["price"],
-        "quantity": quantity
-    })
-    return f"Added {quantity}x **{item['name']}** (${item['price']:.2f}) to your cart."
+    return "\n".join(lines) if lines else "No items were provided to add."
 
 
 @function_tool
 def view_cart() -> str:
     """View the current shopping cart."""
     if not shopping_cart:
-        return "Your shopping cart is empty."
+        return _EMPTY_CART_MSG
 
-    result = "**Your Shopping Cart:**\n\n"
-    total = 0
-    for item in shopping_cart:
+    lines = []
+    total = 0.0
+    for item in shopping_cart.values():
         subtotal = item["price"] * item["quantity"]
         total += subtotal
-        result += f"- {item['quantity']}x **{item['name']}** - ${item['price']:.2f} each = ${subtotal:.2f}\n"
+        lines.append(
+            f"- {item['quantity']}x **{item['name']}** - ${item['price']:.2f} each "
+            f"= ${subtotal:.2f}"
+        )
 
-    result += f"\n**Total: ${total:.2f}**"
-    return result
+    return "**Your Shopping Cart:**\n\n" + "\n".join(lines) + f"\n\n**Total: ${total:.2f}**"
 
 
 @function_tool
@@ -143,11 +210,10 @@ def remove_from_cart(product_id: str) -> str:
     Args:
         product_id: The product ID to remove
     """
-    product_id = product_id.upper()
-    for i, item in enumerate(shopping_cart):
-        if item["id"] == product_id:
-            removed = shopping_cart.pop(i)
-            return f"Removed **{removed['name']}** from your cart."
+    product_id = _norm_id(product_id)
+    removed = shopping_cart.pop(product_id, None)
+    if removed:
+        return f"Removed **{removed['name']}** from your cart."
     return f"Product with ID '{product_id}' is not in your cart."
 
 
@@ -164,16 +230,20 @@ def checkout() -> str:
     if not shopping_cart:
         return "Your cart is empty. Add some items before checking out."
 
-    total = sum(item["price"] * item["quantity"] for item in shopping_cart)
-
-    result = "**Order Summary:**\n\n"
-    for item in shopping_cart:
+    lines = []
+    total = 0.0
+    for item in shopping_cart.values():
         subtotal = item["price"] * item["quantity"]
-        result += f"- {item['quantity']}x {item['name']} - ${subtotal:.2f}\n"
+        total += subtotal
+        lines.append(f"- {item['quantity']}x {item['name']} - ${subtotal:.2f}")
 
-    result += f"\n**Total: ${total:.2f}**\n\n"
-    result += "Thank you for your order! Your order has been placed successfully. "
-    result += "You will receive a confirmation email shortly with delivery details."
+    result = (
+        "**Order Summary:**\n\n"
+        + "\n".join(lines)
+        + f"\n\n**Total: ${total:.2f}**\n\n"
+        "Thank you for your order! Your order has been placed successfully. "
+        "You will receive a confirmation email shortly with delivery details."
+    )
 
     shopping_cart.clear()
     return result
@@ -213,6 +283,7 @@ Remember to:
         search_furniture,
         filter_by_price,
         add_to_cart,
+        add_items_to_cart,
         view_cart,
         remove_from_cart,
         clear_cart,
@@ -1,51 +1,73 @@
 """ProVia Doors catalog data loaded from test.json."""
 
-import json
+import functools
+import re
+from collections import defaultdict
 from pathlib import Path
 
-# Load the catalog from test.json
+# orjson parses significantly faster than stdlib json; fall back if missing
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# The catalog lives in test.json
 CATALOG_PATH = Path(__file__).parent / "test.json"
 
-with open(CATALOG_PATH, "r") as f:
-    PROVIA_CATALOG = json.load(f)
+
+@functools.cache
+def _catalog() -> dict:
+    """Parse test.json on first access; subsequent calls hit the cache.
+
+    Deferring the parse keeps import free of file I/O when no door tool
+    is ever invoked.
+    """
+    return _json.loads(CATALOG_PATH.read_bytes())
+
+
+@functools.cache
+def _categories() -> tuple[str, ...]:
+    """Category keys never change after load; cache them once."""
+    return tuple(_catalog().get("categories", {}).keys())
 
 
 def get_catalog_info() -> dict:
     """Get general catalog information."""
-    return PROVIA_CATALOG.get("catalog_info", {})
+    return _catalog().get("catalog_info", {})
 
 
 def get_all_categories() -> list[str]:
     """Get all product categories."""
-    categories = PROVIA_CATALOG.get("categories", {})
-    return list(categories.keys())
+    return list(_categories())
 
 
 def get_category_details(category_id: str) -> dict | None:
     """Get details about a specific category."""
-    categories = PROVIA_CATALOG.get("categories", {})
+    categories = _catalog().get("categories", {})
     return categories.get(category_id)
 
 
 def get_entry_door_series() -> list[str]:
     """Get all entry door series."""
-    return PROVIA_CATALOG.get("categories", {}).get("entry_doors", {}).get("series", [])
+    return _catalog().get("categories", {}).get("entry_doors", {}).get("series", [])
 
 
 def get_entry_door_product(series_id: str) -> dict | None:
     """Get details about a specific entry door series."""
-    products = PROVIA_CATALOG.get("products", {}).get("entry_doors", {})
+    products = _catalog().get("products", {}).get("entry_doors", {})
     return products.get(series_id)
 
 
+@functools.cache
 def get_all_entry_doors() -> dict:
     """Get all entry door products."""
-    return PROVIA_CATALOG.get("products", {}).get("entry_doors", {})
+    return _catalog().get("products", {}).get("entry_doors", {})
 
 
+@functools.cache
 def get_glass_options() -> dict:
     """Get all glass options."""
-    return PROVIA_CATALOG.get("products", {}).get("glass_options", {})
+    return _catalog().get("products", {}).get("glass_options", {})
 
 
 def get_glass_option(glass_id: str) -> dict | None:
@@ -56,12 +78,13 @@ def get_glass_option(glass_id: str) -> dict | None:
 
 def get_finishes() -> dict:
     """Get all finish options."""
-    return PROVIA_CATALOG.get("products", {}).get("finishes", {})
+    return _catalog().get("products", {}).get("finishes", {})
 
 
+@functools.cache
 def get_hardware_options() -> dict:
     """Get all hardware options."""
-    return PROVIA_CATALOG.get("products", {}).get("hardware", {})
+    return _catalog().get("products", {}).get("hardware", {})
 
 
 def get_hardware_option(hardware_id: str) -> dict | None:
@@ -72,123 +95,186 @@ def get_hardware_option(hardware_id: str) -> dict | None:
 
 def get_accessories() -> dict:
     """Get all accessories."""
-    return PROVIA_CATALOG.get("products", {}).get("accessories", {})
+    return _catalog().get("products", {}).get("accessories", {})
 
 
 def get_frame_options() -> dict:
     """Get all frame options."""
-    return PROVIA_CATALOG.get("products", {}).get("frame_options", {})
+    return _catalog().get("products", {}).get("frame_options", {})
 
 
 def get_patio_doors() -> dict:
     """Get patio door products."""
-    return PROVIA_CATALOG.get("products", {}).get("patio_doors", {})
+    return _catalog().get("products", {}).get("patio_doors", {})
 
 
+@functools.cache
 def get_storm_doors() -> dict:
     """Get storm door products."""
-    return PROVIA_CATALOG.get("products", {}).get("storm_doors", {})
+    return _catalog().get("products", {}).get("storm_doors", {})
 
 
 def get_impact_shield_info() -> dict:
     """Get Impact Shield product information."""
-    return PROVIA_CATALOG.get("products", {}).get("impact_shield", {})
+    return _catalog().get("products", {}).get("impact_shield", {})
 
 
 def get_warranties() -> dict:
     """Get warranty information."""
-    return PROVIA_CATALOG.get("warranties", {})
+    return _catalog().get("warranties", {})
 
 
 def get_energy_star_info() -> dict:
     """Get Energy Star certification information."""
-    return PROVIA_CATALOG.get("energy_star", {})
+    return _catalog().get("energy_star", {})
 
 
 def get_customization_options() -> dict:
     """Get customization options."""
-    return PROVIA_CATALOG.get("customization", {})
+    return _catalog().get("customization", {})
 
 
 def get_regional_considerations() -> dict:
     """Get regional considerations."""
-    return PROVIA_CATALOG.get("regional_considerations", {})
+    return _catalog().get("regional_considerations", {})
 
 
 def get_relationships() -> dict:
     """Get product relationships (compatibility info)."""
-    return PROVIA_CATALOG.get("relationships", {})
+    return _catalog().get("relationships", {})
+
+
+@functools.cache
+def _relationship_index(kind: str) -> dict:
+    """Cache one relationship sub-dict so the compatibility helpers skip
+    the repeated nested .get walk on every call."""
+    return get_relationships().get(kind, {})
+
+
+@functools.cache
+def _search_records() -> tuple[tuple[str, dict], ...]:
+    """Build (blob, summary) pairs for every searchable product once.
+
+    The blob is the lowercased concatenation of the fields a query is
+    matched against, so searches do one substring test per record instead
+    of lowercasing three or four fields per record per query.
+    """
+    records = []
+
+    # Entry doors
+    for series_id, door in get_all_entry_doors().items():
+        blob = " ".join(filter(None, [
+            door.get("series"), door.get("description"), door.get("tier"), series_id
+        ])).lower()
+        records.append((blob, {
+            "type": "entry_door",
+            "id": series_id,
+            "name": door.get("series"),
+            "description": door.get("description"),
+            "tier": door.get("tier")
+        }))
+
+    # Glass options
+    for glass_id, glass in get_glass_options().items():
+        blob = " ".join(filter(None, [
+            glass.get("name"), glass.get("description"), glass_id
+        ])).lower()
+        records.append((blob, {
+            "type": "glass",
+            "id": glass_id,
+            "name": glass.get("name"),
+            "description": glass.get("description")
+        }))
+
+    # Hardware
+    for hw_id, hw in get_hardware_options().items():
+        blob = " ".join(filter(None, [
+            hw.get("name"), hw.get("description"), hw_id
+        ])).lower()
+        records.append((blob, {
+            "type": "hardware",
+            "id": hw_id,
+            "name": hw.get("name"),
+            "description": hw.get("description")
+        }))
+
+    # Storm doors
+    for storm_id, storm in get_storm_doors().items():
+        if storm_id != "overview" and storm_id != "storm_door_hardware":
+            blob = " ".join(filter(None, [
+                storm.get("name"), storm.get("description"), storm_id
+            ])).lower()
+            records.append((blob, {
+                "type": "storm_door",
+                "id": storm_id,
+                "name": storm.get("name"),
+                "description": storm.get("description"),
+                "tier": storm.get("tier")
+            }))
+
+    return tuple(records)
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@functools.cache
+def _search_index() -> dict[str, tuple[int, ...]]:
+    """Inverted token index over the search records, built on first search.
+
+    Maps each token appearing in a record blob to the sorted positions of
+    the records containing it, so whole-word queries resolve with dict
+    probes and a posting-list intersection instead of scanning every blob.
+    """
+    index: dict[str, set[int]] = defaultdict(set)
+    for pos, (blob, _) in enumerate(_search_records()):
+        for token in _TOKEN_RE.findall(blob):
+            index[token].add(pos)
+    return {token: tuple(sorted(positions)) for token, positions in index.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _candidate_positions(token: str) -> frozenset[int]:
+    """Positions of records with any token containing `token` as a substring.
+
+    A blob containing the query string necessarily contains each query
+    token inside one of its own tokens ('door' occurs inside 'doors'), so
+    intersecting these sets gives a safe superset for the exact substring
+    check in search_products.
+    """
+    return frozenset(
+        pos
+        for vocab_token, positions in _search_index().items()
+        if token in vocab_token
+        for pos in positions
+    )
 
 
 def search_products(query: str) -> list[dict]:
     """Search for products by keyword."""
     query = query.lower()
-    results = []
-
-    # Search entry doors
-    entry_doors = get_all_entry_doors()
-    for series_id, door in entry_doors.items():
-        if (query in door.get("series", "").lower() or
-            query in door.get("description", "").lower() or
-            query in door.get("tier", "").lower() or
-            query in series_id.lower()):
-            results.append({
-                "type": "entry_door",
-                "id": series_id,
-                "name": door.get("series"),
-                "description": door.get("description"),
-                "tier": door.get("tier")
-            })
-
-    # Search glass options
-    glass_options = get_glass_options()
-    for glass_id, glass in glass_options.items():
-        if (query in glass.get("name", "").lower() or
-            query in glass.get("description", "").lower() or
-            query in glass_id.lower()):
-            results.append({
-                "type": "glass",
-                "id": glass_id,
-                "name": glass.get("name"),
-                "description": glass.get("description")
-            })
-
-    # Search hardware
-    hardware = get_hardware_options()
-    for hw_id, hw in hardware.items():
-        if (query in hw.get("name", "").lower() or
-            query in hw.get("description", "").lower() or
-            query in hw_id.lower()):
-            results.append({
-                "type": "hardware",
-                "id": hw_id,
-                "name": hw.get("name"),
-                "description": hw.get("description")
-            })
-
-    # Search storm doors
-    storm_doors = get_storm_doors()
-    for storm_id, storm in storm_doors.items():
-        if storm_id != "overview" and storm_id != "storm_door_hardware":
-            if (query in storm.get("name", "").lower() or
-                query in storm.get("description", "").lower() or
-                query in storm_id.lower()):
-                results.append({
-                    "type": "storm_door",
-                    "id": storm_id,
-                    "name": storm.get("name"),
-                    "description": storm.get("description"),
-                    "tier": storm.get("tier")
-                })
+    records = _search_records()
+
+    # Narrow to candidate records via the index, then verify each with the
+    # exact substring test so results match a full blob scan.
+    tokens = _TOKEN_RE.findall(query)
+    if tokens:
+        candidates = set(_candidate_positions(tokens[0]))
+        for token in tokens[1:]:
+            candidates &= _candidate_positions(token)
+            if not candidates:
+                break
+        return [
+            records[pos][1] for pos in sorted(candidates) if query in records[pos][0]
+        ]
 
-    return results
+    # Queries with no alphanumeric tokens fall back to the substring scan
+    return [summary for blob, summary in records if query in blob]
 
 
 def get_compatible_hardware_for_door(door_series: str) -> list[str]:
     """Get compatible hardware for a door series."""
-    relationships = get_relationships()
-    door_hardware = relationships.get("entry_door_to_hardware", {})
-    door_info = door_hardware.get(door_series, {})
+    door_info = _relationship_index("entry_door_to_hardware").get(door_series, {})
 
     compatible = []
     if "optional" in door_info:
@@ -203,15 +289,12 @@ def get_compatible_hardware_for_door(door_series: str) -> list[str]:
 
 def get_compatible_glass_for_door(door_series: str) -> dict:
     """Get compatible glass options for a door series."""
-    relationships = get_relationships()
-    door_glass = relationships.get("entry_door_to_glass", {})
-    return door_glass.get(door_series, {})
+    return _relationship_index("entry_door_to_glass").get(door_series, {})
 
 
 def get_compatible_frames_for_door(door_series: str) -> list[str]:
     """Get compatible frame options for a door series."""
-    relationships = get_relationships()
-    door_frame = relationships.get("entry_door_to_frame", {})
+    door_frame = _relationship_index("entry_door_to_frame")
     return door_frame.get(door_series, {}).get("compatible", [])
 
 
@@ -239,39 +322,41 @@ def format_entry_door_summary(door: dict, series_id: str) -> str:
 
 def format_glass_summary(glass: dict, glass_id: str) -> str:
     """Format glass option details as a readable string."""
-    result = f"""
+    parts = [f"""
 **{glass.get('name', glass_id)}**
 
 {glass.get('description', 'No description available.')}
 
 - **Warranty:** {glass.get('warranty', 'N/A')}
-"""
+"""]
 
     if "standard_options" in glass:
-        result += "\n**Glass Packages:**\n"
-        for opt in glass["standard_options"]:
-            result += f"- {opt['code']}: {opt['type']} pane, {opt.get('gas', 'N/A')} gas, R-value {opt.get('r_value', 'N/A')}\n"
+        parts.append("\n**Glass Packages:**\n")
+        parts.extend(
+            f"- {opt['code']}: {opt['type']} pane, {opt.get('gas', 'N/A')} gas, R-value {opt.get('r_value', 'N/A')}\n"
+            for opt in glass["standard_options"]
+        )
 
     if "styles" in glass:
-        result += f"\n**Available Styles:** {len(glass['styles'])} decorative patterns\n"
+        parts.append(f"\n**Available Styles:** {len(glass['styles'])} decorative patterns\n")
 
-    return result
+    return "".join(parts)
 
 
 def format_hardware_summary(hardware: dict, hw_id: str) -> str:
     """Format hardware option details as a readable string."""
-    result = f"""
+    parts = [f"""
 **{hardware.get('name', hw_id)}**
 
 {hardware.get('description', 'No description available.')}
 
 - **Warranty:** {hardware.get('warranty', 'N/A')}
-"""
+"""]
 
     if "finishes" in hardware:
-        result += f"\n**Available Finishes:** {', '.join(hardware['finishes'])}\n"
+        parts.append(f"\n**Available Finishes:** {', '.join(hardware['finishes'])}\n")
 
     if "styles" in hardware:
-        result += f"\n**Styles:** {', '.join(hardware['styles'])}\n"
+        parts.append(f"\n**Styles:** {', '.join(hardware['styles'])}\n")
 
-    return result
+    return "".join(parts)
@@ -1,5 +1,43 @@
 """Furniture catalog data and helper functions."""
 
+import functools
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(slots=True, frozen=True)
+class Item:
+    """A catalog item as a compact immutable record.
+
+    Slotted storage avoids per-item dict overhead and makes field access
+    an offset load instead of a hash lookup.
+    """
+
+    id: str
+    name: str
+    price: float
+    color: str
+    material: str
+    dimensions: str
+    in_stock: bool
+    description: str
+    # Derived once at construction: lowercase search blob and stock label
+    search_blob: str = field(init=False, repr=False)
+    stock_str: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "search_blob",
+            f"{self.name}\n{self.description}\n{self.material}\n{self.color}".lower(),
+        )
+        object.__setattr__(
+            self, "stock_str", "In Stock" if self.in_stock else "Out of Stock"
+        )
+
 FURNITURE_CATALOG = {
     "sofas": [
         {
@@ -163,63 +201,146 @@ FURNITURE_CATALOG = {
     ],
 }
 
+# Wrap the raw dict literals into compact Item records
+FURNITURE_CATALOG = {
+    category: [Item(**item) for item in items]
+    for category, items in FURNITURE_CATALOG.items()
+}
+
+
+# Index items by ID once at import so lookups are O(1) instead of a
+# nested scan over every category on each call.
+_ID_INDEX: dict[str, Item] = {
+    item.id: item for category in FURNITURE_CATALOG.values() for item in category
+}
+
+# Catalog-wide aggregates computed once at import; tuples so callers
+# can't mutate the cached objects.
+_CATEGORIES: tuple[str, ...] = tuple(FURNITURE_CATALOG.keys())
+
+# Flattened item list with an aligned price array so price filtering is a
+# single vectorized comparison instead of a Python-level double loop.
+_ALL_ITEMS: tuple[Item, ...] = tuple(
+    item for category in FURNITURE_CATALOG.values() for item in category
+)
+_PRICES = np.fromiter((item.price for item in _ALL_ITEMS), dtype=np.float32)
+
+
+def _price_filter(prices: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Return the indices of prices within [lo, hi]."""
+    return np.nonzero((prices >= lo) & (prices <= hi))[0]
+
+
+try:
+    # JIT-compile the filter kernel when numba is available; the tight loop
+    # auto-vectorizes and skips the temporary mask arrays NumPy allocates.
+    from numba import njit
+
+    @njit(cache=True)
+    def _price_filter(prices, lo, hi):  # noqa: F811
+        out = np.empty(prices.size, np.int64)
+        n = 0
+        for i in range(prices.size):
+            if lo <= prices[i] <= hi:
+                out[n] = i
+                n += 1
+        return out[:n]
+
+    # Warmup call so the one-time JIT cost is paid at import, not first query
+    _price_filter(_PRICES, 0.0, 0.0)
+except ImportError:
+    pass
+
+# Inverted token index so single-word queries resolve with one dict lookup
+# instead of a substring scan over every item.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_INVERTED: dict[str, list[str]] = defaultdict(list)
+for _item in _ALL_ITEMS:
+    for _token in set(_TOKEN_RE.findall(_item.search_blob)):
+        _INVERTED[_token].append(_item.id)
+
 
 def get_all_categories() -> list[str]:
     """Get all furniture categories."""
-    return list(FURNITURE_CATALOG.keys())
+    return list(_CATEGORIES)
+
 
+# Shared miss sentinel so category misses don't allocate a fresh list
+_EMPTY: tuple = ()
 
-def get_items_by_category(category: str) -> list[dict]:
+
+def get_items_by_category(category: str) -> list[Item]:
     """Get all items in a category."""
-    category = category.lower()
-    if category in FURNITURE_CATALOG:
-        return FURNITURE_CATALOG[category]
-    return []
+    return FURNITURE_CATALOG.get(category.lower(), _EMPTY)
+
 
+def _norm_id(item_id: str) -> str:
+    """Canonicalize a product ID, skipping the copy when already uppercase."""
+    return item_id if item_id.isupper() else item_id.upper()
 
-def get_item_by_id(item_id: str) -> dict | None:
+
+def get_item_by_id(item_id: str) -> Item | None:
     """Get a specific item by its ID."""
-    item_id = item_id.upper()
-    for category in FURNITURE_CATALOG.values():
-        for item in category:
-            if item["id"] == item_id:
-                return item
-    return None
+    return _ID_INDEX.get(_norm_id(item_id))
+
 
+@functools.lru_cache(maxsize=256)
+def _candidate_ids(token: str) -> frozenset[str]:
+    """IDs of items with any token containing `token` as a substring.
 
-def search_items(query: str) -> list[dict]:
+    A blob containing the query string necessarily contains each query
+    token inside one of its own tokens ('chair' occurs inside
+    'armchair'), so intersecting these sets gives a safe superset for the
+    exact substring check in search_items.
+    """
+    return frozenset(
+        item_id
+        for vocab_token, ids in _INVERTED.items()
+        if token in vocab_token
+        for item_id in ids
+    )
+
+
+def search_items(query: str) -> list[Item]:
     """Search items by name, description, material, or color."""
     query = query.lower()
-    results = []
-    for category in FURNITURE_CATALOG.values():
-        for item in category:
-            if (query in item["name"].lower() or
-                query in item["description"].lower() or
-                query in item["material"].lower() or
-                query in item["color"].lower()):
-                results.append(item)
-    return results
-
-
-def get_items_by_price_range(min_price: float, max_price: float) -> list[dict]:
+    # Narrow to candidate items via the index, then verify each with the
+    # exact substring test so results match a full blob scan.
+    tokens = _TOKEN_RE.findall(query)
+    if tokens:
+        candidates = set(_candidate_ids(tokens[0]))
+        for token in tokens[1:]:
+            candidates &= _candidate_ids(token)
+            if not candidates:
+                break
+        return [
+            item
+            for item in _ALL_ITEMS
+            if item.id in candidates and query in item.search_blob
+        ]
+
+    # Queries with no alphanumeric tokens fall back to the substring scan
+    return [item for item in _ALL_ITEMS if query in item.search_blob]
+
+
+def get_items_by_price_range(min_price: float, max_price: float) -> list[Item]:
     """Get items within a price range."""
-    results = []
-    for category in FURNITURE_CATALOG.values():
-        for item in category:
-            if min_price <= item["price"] <= max_price:
-                results.append(item)
-    return results
+    indices = _price_filter(_PRICES, min_price, max_price)
+    return [_ALL_ITEMS[i] for i in indices]
 
 
-def format_item_details(item: dict) -> str:
-    """Format item details as a readable string."""
-    stock_status = "In Stock" if item["in_stock"] else "Out of Stock"
-    return f"""
-**{item['name']}** (ID: {item['id']})
-- Price: ${item['price']:.2f}
-- Color: {item['color']}
-- Material: {item['material']}
-- Dimensions: {item['dimensions']}
-- Status: {stock_status}
-- Description: {item['description']}
+# Cached template; rendered straight off Item attributes.
+_ITEM_TMPL = """
+**{0.name}** (ID: {0.id})
+- Price: ${0.price:.2f}
+- Color: {0.color}
+- Material: {0.material}
+- Dimensions: {0.dimensions}
+- Status: {0.stock_str}
+- Description: {0.description}
 """
+
+
+def format_item_details(item: Item) -> str:
+    """Format item details as a readable string."""
+    return _ITEM_TMPL.format(item)
@@ -1,18 +1,18 @@
 """ProVia Doors Sales Agent using OpenAI Agents SDK."""
 
+import functools
+import sys
+
 from agents import Agent, function_tool
 from door_catalog import (
     get_catalog_info,
     get_all_categories,
     get_category_details,
     get_entry_door_series,
-    get_entry_door_product,
     get_all_entry_doors,
     get_glass_options,
-    get_glass_option,
     get_finishes,
     get_hardware_options,
-    get_hardware_option,
     get_accessories,
     get_frame_options,
     get_patio_doors,
@@ -31,10 +31,39 @@ from door_catalog import (
     format_hardware_summary,
 )
 
+# Normalized-id -> record maps bound once at import. The parameterised tool
+# impls below do a single dict probe against these instead of calling back
+# into door_catalog on every invocation.
+_DOOR_BY_SERIES = get_all_entry_doors()
+_GLASS_BY_ID = get_glass_options()
+_HARDWARE_BY_ID = get_hardware_options()
+_FINISH_BY_ID = get_finishes()
+_FRAME_BY_ID = get_frame_options()
 
-@function_tool
-def get_company_info() -> str:
-    """Get information about ProVia company and the catalog."""
+
+def _norm(s: str) -> str:
+    """Normalize a tool argument for catalog lookup.
+
+    Skips the .lower() copy when the argument is already lowercase and
+    interns the result, so the handful of recurring ids the model sends
+    share one key object across lru_cache and dict probes.
+    """
+    return sys.intern(s if s.islower() else s.lower())
+
+
+def _truncate(s: str, n: int = 100) -> str:
+    """Clip s to n characters with an ellipsis, fetching it only once."""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+# The catalog is static for the life of the process, so every tool delegates
+# to an lru_cache'd _impl: repeated invocations return the cached string
+# instead of re-walking the catalog and re-formatting. Parameterised impls
+# are keyed on the lowercased argument.
+
+
+@functools.lru_cache(maxsize=1)
+def _company_info_impl() -> str:
     info = get_catalog_info()
     stats = info.get("stats", {})
     return f"""
@@ -55,44 +84,54 @@ def get_company_info() -> str:
 
 
 @function_tool
-def list_product_categories() -> str:
-    """List all available product categories."""
+def get_company_info() -> str:
+    """Get information about ProVia company and the catalog."""
+    return _COMPANY_INFO_STR
+
+
+@functools.lru_cache(maxsize=1)
+def _product_categories_impl() -> str:
     categories = get_all_categories()
-    result = "**Available Product Categories:**\n\n"
+    parts = ["**Available Product Categories:**\n\n"]
     for cat in categories:
         details = get_category_details(cat)
         if details:
             name = details.get("name", cat.replace("_", " ").title())
-            result += f"- **{name}** (ID: {cat})\n"
-    return result
+            parts.append(f"- **{name}** (ID: {cat})\n")
+    return "".join(parts)
 
 
 @function_tool
-def get_entry_door_options() -> str:
-    """Get all entry door series/options available."""
+def list_product_categories() -> str:
+    """List all available product categories."""
+    return _CATEGORIES_STR
+
+
+@functools.lru_cache(maxsize=1)
+def _entry_door_options_impl() -> str:
     series_list = get_entry_door_series()
-    doors = get_all_entry_doors()
+    doors = _DOOR_BY_SERIES
 
-    result = "**Entry Door Series:**\n\n"
+    parts = ["**Entry Door Series:**\n\n"]
     for series_id in series_list:
         door = doors.get(series_id, {})
         tier = door.get("tier", "N/A")
-        desc = door.get("description", "")[:100] + "..." if len(door.get("description", "")) > 100 else door.get("description", "")
+        desc = _truncate(door.get("description", ""))
         energy = "Energy Star" if door.get("energy_star") else ""
-        result += f"**{door.get('series', series_id)}** ({tier}) {energy}\n{desc}\n\n"
+        parts.append(f"**{door.get('series', series_id)}** ({tier}) {energy}\n{desc}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_entry_door_details(series: str) -> str:
-    """Get detailed information about a specific entry door series.
+def get_entry_door_options() -> str:
+    """Get all entry door series/options available."""
+    return _ENTRY_DOORS_STR
 
-    Args:
-        series: The door series ID (embarq, signet, heritage, or legacy)
-    """
-    series = series.lower()
-    door = get_entry_door_product(series)
+
+@functools.lru_cache(maxsize=128)
+def _entry_door_details_impl(series: str) -> str:
+    door = _DOOR_BY_SERIES.get(series)
     if not door:
         return f"Door series '{series}' not found. Available series: embarq, signet, heritage, legacy"
 
@@ -100,43 +139,54 @@ def get_entry_door_details(series: str) -> str:
 
 
 @function_tool
-def get_door_styles(series: str) -> str:
-    """Get available door styles for a specific series.
+def get_entry_door_details(series: str) -> str:
+    """Get detailed information about a specific entry door series.
 
     Args:
         series: The door series ID (embarq, signet, heritage, or legacy)
     """
-    series = series.lower()
-    door = get_entry_door_product(series)
+    return _entry_door_details_impl(_norm(series))
+
+
+@functools.lru_cache(maxsize=128)
+def _door_styles_impl(series: str) -> str:
+    door = _DOOR_BY_SERIES.get(series)
     if not door:
         return f"Door series '{series}' not found."
 
     styles = door.get("door_styles", [])
-    result = f"**Door Styles for {door.get('series', series)}:**\n\n"
+    parts = [f"**Door Styles for {door.get('series', series)}:**\n\n"]
 
-    with_glass = [s for s in styles if s.get("glass")]
-    without_glass = [s for s in styles if not s.get("glass")]
+    # Partition codes in one pass instead of two comprehensions plus a slice
+    with_codes: list[str] = []
+    without_codes: list[str] = []
+    for s in styles:
+        (with_codes if s.get("glass") else without_codes).append(s["code"])
 
-    result += f"**With Glass ({len(with_glass)} styles):**\n"
-    result += ", ".join([s["code"] for s in with_glass[:15]])
-    if len(with_glass) > 15:
-        result += f"... and {len(with_glass) - 15} more"
+    parts.append(f"**With Glass ({len(with_codes)} styles):**\n")
+    parts.append(", ".join(with_codes[:15]))
+    if len(with_codes) > 15:
+        parts.append(f"... and {len(with_codes) - 15} more")
 
-    result += f"\n\n**Without Glass ({len(without_glass)} styles):**\n"
-    result += ", ".join([s["code"] for s in without_glass])
+    parts.append(f"\n\n**Without Glass ({len(without_codes)} styles):**\n")
+    parts.append(", ".join(without_codes))
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_door_skin_options(series: str) -> str:
-    """Get available skin/texture options for a door series.
+def get_door_styles(series: str) -> str:
+    """Get available door styles for a specific series.
 
     Args:
-        series: The door series ID
+        series: The door series ID (embarq, signet, heritage, or legacy)
     """
-    series = series.lower()
-    door = get_entry_door_product(series)
+    return _door_styles_impl(_norm(series))
+
+
+@functools.lru_cache(maxsize=128)
+def _door_skin_options_impl(series: str) -> str:
+    door = _DOOR_BY_SERIES.get(series)
     if not door:
         return f"Door series '{series}' not found."
 
@@ -145,27 +195,37 @@ def get_door_skin_options(series: str) -> str:
 
 
 @function_tool
-def get_glass_options_list() -> str:
-    """Get all available glass options."""
-    glass_opts = get_glass_options()
-    result = "**Glass Options:**\n\n"
+def get_door_skin_options(series: str) -> str:
+    """Get available skin/texture options for a door series.
+
+    Args:
+        series: The door series ID
+    """
+    return _door_skin_options_impl(_norm(series))
+
+
+@functools.lru_cache(maxsize=1)
+def _glass_options_list_impl() -> str:
+    glass_opts = _GLASS_BY_ID
+    parts = ["**Glass Options:**\n\n"]
 
     for glass_id, glass in glass_opts.items():
         name = glass.get("name", glass_id)
-        desc = glass.get("description", "")[:80] + "..." if len(glass.get("description", "")) > 80 else glass.get("description", "")
-        result += f"**{name}** (ID: {glass_id})\n{desc}\n\n"
+        desc = _truncate(glass.get("description", ""), 80)
+        parts.append(f"**{name}** (ID: {glass_id})\n{desc}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_glass_details(glass_id: str) -> str:
-    """Get detailed information about a specific glass option.
+def get_glass_options_list() -> str:
+    """Get all available glass options."""
+    return _GLASS_LIST_STR
 
-    Args:
-        glass_id: The glass option ID (e.g., comfortech_glazing, decorative_glass, privacy_glass)
-    """
-    glass = get_glass_option(glass_id.lower())
+
+@functools.lru_cache(maxsize=128)
+def _glass_details_impl(glass_id: str) -> str:
+    glass = _GLASS_BY_ID.get(glass_id)
     if not glass:
         return f"Glass option '{glass_id}' not found. Use get_glass_options_list() to see available options."
 
@@ -173,47 +233,62 @@ def get_glass_details(glass_id: str) -> str:
 
 
 @function_tool
-def get_decorative_glass_styles() -> str:
-    """Get all decorative glass pattern styles available."""
-    glass = get_glass_option("decorative_glass")
+def get_glass_details(glass_id: str) -> str:
+    """Get detailed information about a specific glass option.
+
+    Args:
+        glass_id: The glass option ID (e.g., comfortech_glazing, decorative_glass, privacy_glass)
+    """
+    return _glass_details_impl(_norm(glass_id))
+
+
+@functools.lru_cache(maxsize=1)
+def _decorative_glass_styles_impl() -> str:
+    glass = _GLASS_BY_ID.get("decorative_glass")
     if not glass:
         return "Decorative glass information not available."
 
     styles = glass.get("styles", [])
-    result = "**Decorative Glass Styles:**\n\n"
+    parts = ["**Decorative Glass Styles:**\n\n"]
 
     for style in styles:
         name = style.get("name", "")
         privacy = style.get("privacy", "N/A")
         caming = ", ".join(style.get("caming", []))
         new_tag = " NEW!" if style.get("new") else ""
-        result += f"- **{name}**{new_tag} - Privacy: {privacy}/10, Caming: {caming}\n"
+        parts.append(f"- **{name}**{new_tag} - Privacy: {privacy}/10, Caming: {caming}\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_hardware_options_list() -> str:
-    """Get all available hardware options."""
-    hardware = get_hardware_options()
-    result = "**Hardware Options:**\n\n"
+def get_decorative_glass_styles() -> str:
+    """Get all decorative glass pattern styles available."""
+    return _DECORATIVE_STYLES_STR
+
+
+@functools.lru_cache(maxsize=1)
+def _hardware_options_list_impl() -> str:
+    hardware = _HARDWARE_BY_ID
+    parts = ["**Hardware Options:**\n\n"]
 
     for hw_id, hw in hardware.items():
         name = hw.get("name", hw_id)
-        desc = hw.get("description", "")[:80] + "..." if len(hw.get("description", "")) > 80 else hw.get("description", "")
-        result += f"**{name}** (ID: {hw_id})\n{desc}\n\n"
+        desc = _truncate(hw.get("description", ""), 80)
+        parts.append(f"**{name}** (ID: {hw_id})\n{desc}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_hardware_details(hardware_id: str) -> str:
-    """Get detailed information about a specific hardware option.
+def get_hardware_options_list() -> str:
+    """Get all available hardware options."""
+    return _HARDWARE_LIST_STR
 
-    Args:
-        hardware_id: The hardware ID (e.g., trilennium_multipoint, emtek_mortise, schlage_electronic)
-    """
-    hw = get_hardware_option(hardware_id.lower())
+
+@functools.lru_cache(maxsize=128)
+def _hardware_details_impl(hardware_id: str) -> str:
+    hw = _HARDWARE_BY_ID.get(hardware_id)
     if not hw:
         return f"Hardware option '{hardware_id}' not found. Use get_hardware_options_list() to see available options."
 
@@ -221,159 +296,201 @@ def get_hardware_details(hardware_id: str) -> str:
 
 
 @function_tool
-def get_finish_options() -> str:
-    """Get all available finish options (stain, paint, glazed)."""
-    finishes = get_finishes()
-    result = "**Finish Options:**\n\n"
+def get_hardware_details(hardware_id: str) -> str:
+    """Get detailed information about a specific hardware option.
+
+    Args:
+        hardware_id: The hardware ID (e.g., trilennium_multipoint, emtek_mortise, schlage_electronic)
+    """
+    return _hardware_details_impl(_norm(hardware_id))
+
+
+@functools.lru_cache(maxsize=1)
+def _finish_options_impl() -> str:
+    finishes = _FINISH_BY_ID
+    parts = ["**Finish Options:**\n\n"]
 
     for finish_id, finish in finishes.items():
         name = finish.get("name", finish_id)
         desc = finish.get("description", "")
-        result += f"**{name}**\n{desc}\n\n"
+        parts.append(f"**{name}**\n{desc}\n\n")
 
         # Show colors if available
         if "colors" in finish:
-            result += f"Colors: {', '.join(finish['colors'][:8])}"
+            parts.append(f"Colors: {', '.join(finish['colors'][:8])}")
             if len(finish.get('colors', [])) > 8:
-                result += f"... and {len(finish['colors']) - 8} more"
-            result += "\n"
+                parts.append(f"... and {len(finish['colors']) - 8} more")
+            parts.append("\n")
 
         if "standard_colors" in finish:
-            result += f"Standard Colors: {', '.join(finish['standard_colors'][:8])}"
+            parts.append(f"Standard Colors: {', '.join(finish['standard_colors'][:8])}")
             if len(finish.get('standard_colors', [])) > 8:
-                result += f"... and more"
-            result += "\n"
+                parts.append("... and more")
+            parts.append("\n")
 
-        result += "\n"
+        parts.append("\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_storm_door_options() -> str:
-    """Get all storm door series and options."""
+def get_finish_options() -> str:
+    """Get all available finish options (stain, paint, glazed)."""
+    return _FINISHES_STR
+
+
+@functools.lru_cache(maxsize=1)
+def _storm_door_options_impl() -> str:
     storm = get_storm_doors()
-    result = "**Storm Door Series:**\n\n"
+    parts = ["**Storm Door Series:**\n\n"]
 
     for storm_id, door in storm.items():
         if storm_id not in ["overview", "storm_door_hardware"]:
             name = door.get("name", storm_id)
             tier = door.get("tier", "")
             desc = door.get("description", "")
-            result += f"**{name}** ({tier})\n{desc}\n\n"
+            parts.append(f"**{name}** ({tier})\n{desc}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_patio_door_options() -> str:
-    """Get patio door options."""
+def get_storm_door_options() -> str:
+    """Get all storm door series and options."""
+    return _storm_door_options_impl()
+
+
+@functools.lru_cache(maxsize=1)
+def _patio_door_options_impl() -> str:
     patio = get_patio_doors()
-    result = "**Patio Door Options:**\n\n"
+    parts = ["**Patio Door Options:**\n\n"]
 
     for patio_id, door in patio.items():
         name = door.get("name", patio_id)
         desc = door.get("description", "")
-        result += f"**{name}**\n{desc}\n\n"
+        parts.append(f"**{name}**\n{desc}\n\n")
 
         if "configurations" in door:
-            result += f"Configurations: {', '.join(door['configurations'])}\n"
+            parts.append(f"Configurations: {', '.join(door['configurations'])}\n")
 
-        result += "\n"
+        parts.append("\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_frame_options_list() -> str:
-    """Get all frame options available."""
-    frames = get_frame_options()
-    result = "**Frame Options:**\n\n"
+def get_patio_door_options() -> str:
+    """Get patio door options."""
+    return _patio_door_options_impl()
+
+
+@functools.lru_cache(maxsize=1)
+def _frame_options_list_impl() -> str:
+    frames = _FRAME_BY_ID
+    parts = ["**Frame Options:**\n\n"]
 
     for frame_id, frame in frames.items():
         name = frame.get("name", frame_id)
         desc = frame.get("description", "")
         warranty = frame.get("warranty", "N/A")
-        result += f"**{name}**\n{desc}\nWarranty: {warranty}\n\n"
+        parts.append(f"**{name}**\n{desc}\nWarranty: {warranty}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def check_compatibility(door_series: str) -> str:
-    """Check what hardware, glass, and frames are compatible with a door series.
+def get_frame_options_list() -> str:
+    """Get all frame options available."""
+    return _frame_options_list_impl()
 
-    Args:
-        door_series: The door series ID (embarq, signet, heritage, or legacy)
-    """
-    door_series = door_series.lower()
-    door = get_entry_door_product(door_series)
+
+@functools.lru_cache(maxsize=128)
+def _check_compatibility_impl(door_series: str) -> str:
+    door = _DOOR_BY_SERIES.get(door_series)
     if not door:
         return f"Door series '{door_series}' not found."
 
-    result = f"**Compatibility for {door.get('series', door_series)}:**\n\n"
+    parts = [f"**Compatibility for {door.get('series', door_series)}:**\n\n"]
 
     # Hardware
     hardware = get_compatible_hardware_for_door(door_series)
-    result += "**Compatible Hardware:**\n"
-    result += ", ".join(hardware) if hardware else "All hardware types"
-    result += "\n\n"
+    parts.append("**Compatible Hardware:**\n")
+    parts.append(", ".join(hardware) if hardware else "All hardware types")
+    parts.append("\n\n")
 
     # Glass
     glass = get_compatible_glass_for_door(door_series)
-    result += "**Glass Options:**\n"
+    parts.append("**Glass Options:**\n")
     if glass:
-        result += f"- Glazing: {', '.join(glass.get('glazing', []))}\n"
-        result += f"- Decorative: {glass.get('decorative', 'N/A')}\n"
-        result += f"- Dialogue Glass: {'Yes' if glass.get('dialogue') else 'No'}\n"
-        result += f"- Internal Blinds: {'Yes' if glass.get('internal_blinds') else 'No'}\n"
-    result += "\n"
+        parts.append(f"- Glazing: {', '.join(glass.get('glazing', []))}\n")
+        parts.append(f"- Decorative: {glass.get('decorative', 'N/A')}\n")
+        parts.append(f"- Dialogue Glass: {'Yes' if glass.get('dialogue') else 'No'}\n")
+        parts.append(f"- Internal Blinds: {'Yes' if glass.get('internal_blinds') else 'No'}\n")
+    parts.append("\n")
 
     # Frames
     frames = get_compatible_frames_for_door(door_series)
-    result += "**Compatible Frames:**\n"
-    result += ", ".join(frames) if frames else "Standard frames"
+    parts.append("**Compatible Frames:**\n")
+    parts.append(", ".join(frames) if frames else "Standard frames")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_warranty_info(product_type: str = "all") -> str:
-    """Get warranty information for products.
+def check_compatibility(door_series: str) -> str:
+    """Check what hardware, glass, and frames are compatible with a door series.
 
     Args:
-        product_type: Type of product (entry_doors, glass, hardware, storm_doors, patio_doors, or all)
+        door_series: The door series ID (embarq, signet, heritage, or legacy)
     """
+    return _check_compatibility_impl(_norm(door_series))
+
+
+@functools.lru_cache(maxsize=128)
+def _warranty_info_impl(product_type: str) -> str:
     warranties = get_warranties()
 
-    if product_type.lower() == "all":
-        result = "**ProVia Warranty Information:**\n\n"
+    if product_type == "all":
+        parts = ["**ProVia Warranty Information:**\n\n"]
         for category, items in warranties.items():
-            result += f"**{category.replace('_', ' ').title()}:**\n"
+            parts.append(f"**{category.replace('_', ' ').title()}:**\n")
             if isinstance(items, dict):
-                for item, warranty in items.items():
-                    result += f"- {item.replace('_', ' ').title()}: {warranty}\n"
+                parts.extend(
+                    f"- {item.replace('_', ' ').title()}: {warranty}\n"
+                    for item, warranty in items.items()
+                )
             else:
-                result += f"- {items}\n"
-            result += "\n"
-        return result
+                parts.append(f"- {items}\n")
+            parts.append("\n")
+        return "".join(parts)
     else:
-        category_warranties = warranties.get(product_type.lower())
+        category_warranties = warranties.get(product_type)
         if not category_warranties:
             return f"No warranty info found for '{product_type}'"
 
-        result = f"**{product_type.replace('_', ' ').title()} Warranties:**\n\n"
+        parts = [f"**{product_type.replace('_', ' ').title()} Warranties:**\n\n"]
         if isinstance(category_warranties, dict):
-            for item, warranty in category_warranties.items():
-                result += f"- {item.replace('_', ' ').title()}: {warranty}\n"
+            parts.extend(
+                f"- {item.replace('_', ' ').title()}: {warranty}\n"
+                for item, warranty in category_warranties.items()
+            )
         else:
-            result += f"- {category_warranties}\n"
-        return result
+            parts.append(f"- {category_warranties}\n")
+        return "".join(parts)
 
 
 @function_tool
-def get_energy_star_details() -> str:
-    """Get Energy Star certification details."""
+def get_warranty_info(product_type: str = "all") -> str:
+    """Get warranty information for products.
+
+    Args:
+        product_type: Type of product (entry_doors, glass, hardware, storm_doors, patio_doors, or all)
+    """
+    return _warranty_info_impl(_norm(product_type))
+
+
+@functools.lru_cache(maxsize=1)
+def _energy_star_details_impl() -> str:
     energy = get_energy_star_info()
 
     result = f"""**Energy Star Certification:**
@@ -396,87 +513,119 @@ ProVia has **{energy.get('certification_rate', '90%+')}** of products Energy Sta
 
 
 @function_tool
-def search_provia_products(query: str) -> str:
-    """Search for ProVia products by keyword.
+def get_energy_star_details() -> str:
+    """Get Energy Star certification details."""
+    return _energy_star_details_impl()
 
-    Args:
-        query: Search term (e.g., 'fiberglass', 'steel', 'premium', 'security')
-    """
+
+@functools.lru_cache(maxsize=128)
+def _search_provia_products_impl(query: str) -> str:
     results = search_products(query)
 
     if not results:
         return f"No products found matching '{query}'. Try different keywords like: fiberglass, steel, premium, decorative, electronic, security"
 
-    response = f"**Search Results for '{query}':** ({len(results)} found)\n\n"
+    parts = [f"**Search Results for '{query}':** ({len(results)} found)\n\n"]
 
     for item in results[:10]:
-        response += f"**{item.get('name', item['id'])}** ({item['type'].replace('_', ' ').title()})\n"
+        parts.append(f"**{item.get('name', item['id'])}** ({item['type'].replace('_', ' ').title()})\n")
         if item.get('tier'):
-            response += f"Tier: {item['tier']}\n"
-        response += f"{item.get('description', '')[:100]}...\n\n"
+            parts.append(f"Tier: {item['tier']}\n")
+        parts.append(f"{_truncate(item.get('description', ''))}\n\n")
 
     if len(results) > 10:
-        response += f"...and {len(results) - 10} more results"
+        parts.append(f"...and {len(results) - 10} more results")
 
-    return response
+    return "".join(parts)
 
 
 @function_tool
-def get_regional_requirements(region: str) -> str:
-    """Get regional requirements and considerations.
+def search_provia_products(query: str) -> str:
+    """Search for ProVia products by keyword.
 
     Args:
-        region: Region type (impact_shield, certified_wind_load, high_altitude, coastal, northern_climate)
+        query: Search term (e.g., 'fiberglass', 'steel', 'premium', 'security')
     """
+    return _search_provia_products_impl(_norm(query))
+
+
+@functools.lru_cache(maxsize=128)
+def _regional_requirements_impl(region: str) -> str:
     regions = get_regional_considerations()
-    region_info = regions.get(region.lower())
+    region_info = regions.get(region)
 
     if not region_info:
         available = list(regions.keys())
         return f"Region '{region}' not found. Available: {', '.join(available)}"
 
-    result = f"**{region.replace('_', ' ').title()} Requirements:**\n\n"
+    parts = [f"**{region.replace('_', ' ').title()} Requirements:**\n\n"]
 
     for key, value in region_info.items():
         if isinstance(value, list):
-            result += f"**{key.replace('_', ' ').title()}:**\n"
-            for item in value:
-                result += f"- {item}\n"
+            parts.append(f"**{key.replace('_', ' ').title()}:**\n")
+            parts.extend(f"- {item}\n" for item in value)
         else:
-            result += f"**{key.replace('_', ' ').title()}:** {value}\n"
-        result += "\n"
+            parts.append(f"**{key.replace('_', ' ').title()}:** {value}\n")
+        parts.append("\n")
 
-    return result
+    return "".join(parts)
 
 
 @function_tool
-def get_customization_info() -> str:
-    """Get information about customization options available."""
+def get_regional_requirements(region: str) -> str:
+    """Get regional requirements and considerations.
+
+    Args:
+        region: Region type (impact_shield, certified_wind_load, high_altitude, coastal, northern_climate)
+    """
+    return _regional_requirements_impl(_norm(region))
+
+
+@functools.lru_cache(maxsize=1)
+def _customization_info_impl() -> str:
     custom = get_customization_options()
 
-    result = "**Customization Options:**\n\n"
+    parts = ["**Customization Options:**\n\n"]
 
     # Sizing
     sizing = custom.get("sizing", {})
-    result += "**Custom Sizing:**\n"
+    parts.append("**Custom Sizing:**\n")
     for series, options in sizing.items():
         widths = "Yes" if options.get("custom_widths") else "No"
         heights = "Yes" if options.get("custom_heights") else "No"
         increment = options.get("increment", "N/A")
-        result += f"- {series.title()}: Widths: {widths}, Heights: {heights}, Increment: {increment}\n"
+        parts.append(f"- {series.title()}: Widths: {widths}, Heights: {heights}, Increment: {increment}\n")
 
-    result += "\n**Dual Finish:**\n"
+    parts.append("\n**Dual Finish:**\n")
     dual = custom.get("dual_finish", {})
-    result += f"Available on: {', '.join(dual.get('available_on', []))}\n"
-    result += f"Note: {dual.get('note', 'N/A')}\n"
+    parts.append(f"Available on: {', '.join(dual.get('available_on', []))}\n")
+    parts.append(f"Note: {dual.get('note', 'N/A')}\n")
 
-    result += "\n**Custom Colors:**\n"
+    parts.append("\n**Custom Colors:**\n")
     colors = custom.get("custom_colors", {})
-    result += f"Paint: {'Available' if colors.get('paint') else 'No'}\n"
-    result += f"Stain: {colors.get('stain', 'N/A')}\n"
-    result += f"Lead Time: {colors.get('lead_time', 'N/A')}\n"
+    parts.append(f"Paint: {'Available' if colors.get('paint') else 'No'}\n")
+    parts.append(f"Stain: {colors.get('stain', 'N/A')}\n")
+    parts.append(f"Lead Time: {colors.get('lead_time', 'N/A')}\n")
 
-    return result
+    return "".join(parts)
+
+
+@function_tool
+def get_customization_info() -> str:
+    """Get information about customization options available."""
+    return _customization_info_impl()
+
+
+# Constant responses rendered once at import: these listings never change
+# for the life of the process, so the tools above return the bound strings
+# with zero per-request catalog work.
+_COMPANY_INFO_STR = _company_info_impl()
+_CATEGORIES_STR = _product_categories_impl()
+_ENTRY_DOORS_STR = _entry_door_options_impl()
+_GLASS_LIST_STR = _glass_options_list_impl()
+_DECORATIVE_STYLES_STR = _decorative_glass_styles_impl()
+_HARDWARE_LIST_STR = _hardware_options_list_impl()
+_FINISHES_STR = _finish_options_impl()
 
 
 # Create the ProVia sales agent
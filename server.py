@@ -1,23 +1,67 @@
 """FastAPI server for the furniture sales agent."""
 
 import asyncio
-import json
 import os
+from collections import deque
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
-from agents import Runner
+from agents import Runner, set_default_openai_client
+from openai import AsyncOpenAI
+from openai.types.responses import ResponseTextDeltaEvent
+
 from agent import furniture_agent, shopping_cart
 
 load_dotenv()
 
-# Store conversation history per connection
-conversations: dict[str, list] = {}
+# Registering one shared client as the SDK default means the startup
+# warmup below primes the same connection pool the agent runs use
+client = AsyncOpenAI()
+set_default_openai_client(client)
+
+# Cap per-session history so the agent input (and its token cost) stays
+# bounded: deques cap message count, and _trim_history pops the oldest
+# turns until the estimated token footprint fits the window.
+MAX_HISTORY_MESSAGES = 40
+MAX_HISTORY_TOKENS = 4000
+
+# A hung agent run should fail the turn, not deadlock the socket
+AGENT_TIMEOUT_S = 30
+
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.encoding_for_model("gpt-4o")
+
+    def _count_tokens(text: str) -> int:
+        return len(_ENCODING.encode(text))
+except ImportError:
+    # ~4 chars per token is close enough for window trimming
+    def _count_tokens(text: str) -> int:
+        return len(text) // 4 + 1
+
+
+def _trim_history(history: deque) -> None:
+    """Drop the oldest turns until the history fits the token budget."""
+    total = sum(_count_tokens(content) for _, content in history)
+    while len(history) > 1 and total > MAX_HISTORY_TOKENS:
+        _, dropped = history.popleft()
+        total -= _count_tokens(dropped)
+
+
+async def _send_json(websocket: WebSocket, obj: dict) -> None:
+    """Send a JSON frame serialized with orjson as a binary websocket frame.
+
+    send_bytes skips the decode-to-str round trip that send_text would
+    pay on every frame of the hot word/audio send loop.
+    """
+    await websocket.send_bytes(orjson.dumps(obj))
 
 
 @asynccontextmanager
@@ -25,6 +69,16 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown."""
     print("Furniture Sales Agent server starting...")
     print("Make sure OPENAI_API_KEY is set in your environment or .env file")
+    # Read the chat page once; serving it per request would put sync file
+    # I/O on the event loop
+    with open("static/index.html", "rb") as f:
+        app.state.index_html = f.read()
+    # Prime the HTTP connection pool so the first user turn doesn't pay
+    # the TLS handshake; models.list is the cheapest authenticated call
+    try:
+        await client.models.list()
+    except Exception as e:
+        print(f"OpenAI warmup failed: {e}")
     yield
     print("Server shutting down...")
 
@@ -38,17 +92,23 @@ app = FastAPI(
 
 @app.get("/")
 async def get_index():
-    """Serve the main chat interface."""
-    with open("static/index.html", "r") as f:
-        return HTMLResponse(content=f.read())
+    """Serve the main chat interface from the bytes cached at startup."""
+    return HTMLResponse(content=app.state.index_html)
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time chat."""
     await websocket.accept()
-    session_id = str(id(websocket))
-    conversations[session_id] = []
+    # History lives on the connection coroutine itself: no keyed lookups,
+    # and it's reclaimed automatically however the handler exits. Stored as
+    # (role, content) tuples, materialized into dicts at the Runner boundary.
+    history: deque = deque(maxlen=MAX_HISTORY_MESSAGES)
+    # Chaining runs via previous_response_id lets the API replay the stored
+    # conversation server-side, so each turn uploads only the new message
+    # instead of the whole history. The deque is kept as a fallback: if a
+    # run fails the chain is dropped and the next turn resends the tail.
+    last_response_id: str | None = None
 
     # Clear shopping cart for new session
     shopping_cart.clear()
@@ -59,63 +119,77 @@ async def websocket_endpoint(websocket: WebSocket):
             "type": "assistant",
             "content": "Welcome to Home Haven Furniture Store! I'm your personal furniture assistant. How can I help you today? Feel free to browse our categories (Sofas, Chairs, Tables, Beds, Storage) or tell me what you're looking for!"
         }
-        await websocket.send_json(welcome_message)
+        await _send_json(websocket, welcome_message)
 
         while True:
             # Receive message from client
             data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = orjson.loads(data)
             user_message = message_data.get("message", "")
 
             if not user_message.strip():
                 continue
 
-            # Add user message to conversation history
-            conversations[session_id].append({
-                "role": "user",
-                "content": user_message
-            })
+            # Add user message to conversation history, keeping the tail
+            history.append(("user", user_message))
+            _trim_history(history)
 
             # Send typing indicator
-            await websocket.send_json({"type": "typing", "content": True})
+            await _send_json(websocket, {"type": "typing", "content": True})
 
             try:
-                # Run the agent
-                result = await Runner.run(
-                    furniture_agent,
-                    input=conversations[session_id],
-                )
+                # Run the agent and forward text deltas as they arrive, so
+                # the first tokens reach the client before the run finishes
+                async with asyncio.timeout(AGENT_TIMEOUT_S):
+                    if last_response_id is not None:
+                        run_input = [{"role": "user", "content": user_message}]
+                    else:
+                        run_input = [
+                            {"role": role, "content": content}
+                            for role, content in history
+                        ]
+                    result = Runner.run_streamed(
+                        furniture_agent,
+                        input=run_input,
+                        previous_response_id=last_response_id,
+                    )
+                    async for event in result.stream_events():
+                        if event.type == "raw_response_event" and isinstance(
+                            event.data, ResponseTextDeltaEvent
+                        ):
+                            await _send_json(websocket, {
+                                "type": "assistant_delta",
+                                "content": event.data.delta
+                            })
 
                 # Extract the response
                 response_content = result.final_output
+                last_response_id = result.last_response_id
 
                 # Add assistant response to history
-                conversations[session_id].append({
-                    "role": "assistant",
-                    "content": response_content
-                })
+                history.append(("assistant", response_content))
 
-                # Send response
-                await websocket.send_json({
+                # Send the full response to finalize the streamed message.
+                # typing_done folds the typing-off signal into this frame,
+                # saving a third websocket send per turn.
+                await _send_json(websocket, {
                     "type": "assistant",
-                    "content": response_content
+                    "content": response_content,
+                    "typing_done": True
                 })
 
             except Exception as e:
+                # Drop the chain; the next turn resends the local history
+                last_response_id = None
                 error_message = f"I apologize, but I encountered an error: {str(e)}. Please try again."
-                await websocket.send_json({
+                await _send_json(websocket, {
                     "type": "error",
-                    "content": error_message
+                    "content": error_message,
+                    "typing_done": True
                 })
 
-            # Stop typing indicator
-            await websocket.send_json({"type": "typing", "content": False})
-
     except WebSocketDisconnect:
-        # Clean up on disconnect
-        if session_id in conversations:
-            del conversations[session_id]
-        print(f"Client {session_id} disconnected")
+        print("Client disconnected")
 
 
 @app.get("/health")
@@ -130,4 +204,19 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools cut event-loop and HTTP parsing overhead, and one
+    # worker per core sidesteps the GIL under concurrent connections.
+    # Session state is per-connection and a websocket sticks to the worker
+    # that accepted it, so in-process history stays correct.
+    # permessage-deflate stays on: this server only ships JSON text, which
+    # compresses well (unlike the voice server's opus frames).
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=True,
+        workers=os.cpu_count(),
+    )
@@ -2,26 +2,85 @@
 
 import asyncio
 import base64
-import json
 import os
+from collections import deque
+import re
 from contextlib import asynccontextmanager
 
+import orjson
+import websockets
 from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from openai import AsyncOpenAI
 
-from agents import Runner
+from agents import Runner, set_default_openai_client
+from openai.types.responses import ResponseTextDeltaEvent
+
 from provia_agent import provia_agent
 
 load_dotenv()
 
-# Initialize OpenAI client for TTS
+# Initialize OpenAI client for TTS. Registering it as the SDK default
+# too means the welcome-line synthesis at startup primes the same
+# connection pool the agent runs use, so the first user turn skips the
+# TLS handshake.
 client = AsyncOpenAI()
+set_default_openai_client(client)
+
+# Cap per-session history so the agent input (and its token cost) stays
+# bounded: deques cap message count, and _trim_history pops the oldest
+# turns until the estimated token footprint fits the window.
+MAX_HISTORY_MESSAGES = 40
+MAX_HISTORY_TOKENS = 4000
+
+# A hung agent run should fail the turn, not deadlock the socket
+AGENT_TIMEOUT_S = 30
+
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.encoding_for_model("gpt-4o")
+
+    def _count_tokens(text: str) -> int:
+        return len(_ENCODING.encode(text))
+except ImportError:
+    # ~4 chars per token is close enough for window trimming
+    def _count_tokens(text: str) -> int:
+        return len(text) // 4 + 1
+
+
+def _trim_history(history: deque) -> None:
+    """Drop the oldest turns until the history fits the token budget."""
+    total = sum(_count_tokens(content) for _, content in history)
+    while len(history) > 1 and total > MAX_HISTORY_TOKENS:
+        _, dropped = history.popleft()
+        total -= _count_tokens(dropped)
+
+
+# Removes markdown markers in one pass instead of four .replace scans
+_TTS_STRIP = str.maketrans({"*": None, "#": None, "`": None})
+
+# First byte of raw audio frames; JSON frames always start with '{'
+_AUDIO_TAG = b"\x01"
+
+# At most this many sentences sit between the LLM stream and the speaker;
+# a full queue pushes back on sentence (and TTS) production instead of
+# buffering a whole response's audio for a slow client
+_SPEAK_QUEUE_MAX = 4
+
+# Spoken on every voice connect; its audio is synthesized once at startup
+WELCOME_SPEECH = "Welcome to ProVia Doors! I'm ready to help you find the perfect door."
+
 
-# Store conversation history per connection
-conversations: dict[str, list] = {}
+async def _send_json(websocket: WebSocket, obj: dict) -> None:
+    """Send a JSON frame serialized with orjson as a binary websocket frame.
+
+    send_bytes skips the decode-to-str round trip that send_text would
+    pay on every frame of the hot word/audio send loop.
+    """
+    await websocket.send_bytes(orjson.dumps(obj))
 
 
 @asynccontextmanager
@@ -29,6 +88,23 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown."""
     print("ProVia Doors Voice Sales Agent starting...")
     print("Make sure OPENAI_API_KEY is set in your environment or .env file")
+    # Read the chat page once; serving it per request would put sync file
+    # I/O on the event loop
+    with open("static/voice_index.html", "rb") as f:
+        app.state.index_html = f.read()
+    # Synthesize the fixed welcome line once so each connect replays the
+    # cached MP3 instead of paying a TTS round trip
+    try:
+        response = await client.audio.speech.create(
+            model="tts-1",
+            voice="alloy",
+            input=WELCOME_SPEECH,
+            response_format="opus"
+        )
+        app.state.welcome_audio = response.content
+    except Exception as e:
+        print(f"Welcome TTS prefetch failed: {e}")
+        app.state.welcome_audio = None
     yield
     print("Server shutting down...")
 
@@ -42,17 +118,23 @@ app = FastAPI(
 
 @app.get("/")
 async def get_index():
-    """Serve the main chat interface."""
-    with open("static/voice_index.html", "r") as f:
-        return HTMLResponse(content=f.read())
+    """Serve the main chat interface from the bytes cached at startup."""
+    return HTMLResponse(content=app.state.index_html)
 
 
 @app.websocket("/ws/text")
 async def websocket_text_endpoint(websocket: WebSocket):
     """WebSocket endpoint for text-based chat."""
     await websocket.accept()
-    session_id = str(id(websocket))
-    conversations[session_id] = []
+    # History lives on the connection coroutine itself: no keyed lookups,
+    # and it's reclaimed automatically however the handler exits. Stored as
+    # (role, content) tuples, materialized into dicts at the Runner boundary.
+    history: deque = deque(maxlen=MAX_HISTORY_MESSAGES)
+    # Chaining runs via previous_response_id lets the API replay the stored
+    # conversation server-side, so each turn uploads only the new message
+    # instead of the whole history. The deque is kept as a fallback: if a
+    # run fails the chain is dropped and the next turn resends the tail.
+    last_response_id: str | None = None
 
     try:
         # Send welcome message
@@ -60,80 +142,104 @@ async def websocket_text_endpoint(websocket: WebSocket):
             "type": "assistant",
             "content": "Welcome to ProVia Doors! I'm your personal door consultant. I can help you find the perfect entry door, storm door, or patio door for your home. Would you like to explore our door series, or do you have specific requirements in mind?"
         }
-        await websocket.send_json(welcome_message)
+        await _send_json(websocket, welcome_message)
 
         while True:
             # Receive message from client
             data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = orjson.loads(data)
             user_message = message_data.get("message", "")
 
             if not user_message.strip():
                 continue
 
-            # Add user message to conversation history
-            conversations[session_id].append({
-                "role": "user",
-                "content": user_message
-            })
+            # Add user message to conversation history, keeping the tail
+            history.append(("user", user_message))
+            _trim_history(history)
 
             # Send typing indicator
-            await websocket.send_json({"type": "typing", "content": True})
+            await _send_json(websocket, {"type": "typing", "content": True})
 
             try:
-                # Run the agent
-                result = await Runner.run(
-                    provia_agent,
-                    input=conversations[session_id],
-                )
+                # Run the agent and forward text deltas as they arrive, so
+                # the first tokens reach the client before the run finishes
+                async with asyncio.timeout(AGENT_TIMEOUT_S):
+                    if last_response_id is not None:
+                        run_input = [{"role": "user", "content": user_message}]
+                    else:
+                        run_input = [
+                            {"role": role, "content": content}
+                            for role, content in history
+                        ]
+                    result = Runner.run_streamed(
+                        provia_agent,
+                        input=run_input,
+                        previous_response_id=last_response_id,
+                    )
+                    async for event in result.stream_events():
+                        if event.type == "raw_response_event" and isinstance(
+                            event.data, ResponseTextDeltaEvent
+                        ):
+                            await _send_json(websocket, {
+                                "type": "assistant_delta",
+                                "content": event.data.delta
+                            })
 
                 # Extract the response
                 response_content = result.final_output
+                last_response_id = result.last_response_id
 
                 # Add assistant response to history
-                conversations[session_id].append({
-                    "role": "assistant",
-                    "content": response_content
-                })
+                history.append(("assistant", response_content))
 
-                # Send response
-                await websocket.send_json({
+                # Send the full response to finalize the streamed message.
+                # typing_done folds the typing-off signal into this frame,
+                # saving a third websocket send per turn.
+                await _send_json(websocket, {
                     "type": "assistant",
-                    "content": response_content
+                    "content": response_content,
+                    "typing_done": True
                 })
 
             except Exception as e:
+                # Drop the chain; the next turn resends the local history
+                last_response_id = None
                 error_message = f"I apologize, but I encountered an error: {str(e)}. Please try again."
-                await websocket.send_json({
+                await _send_json(websocket, {
                     "type": "error",
-                    "content": error_message
+                    "content": error_message,
+                    "typing_done": True
                 })
 
-            # Stop typing indicator
-            await websocket.send_json({"type": "typing", "content": False})
-
     except WebSocketDisconnect:
-        # Clean up on disconnect
-        if session_id in conversations:
-            del conversations[session_id]
-        print(f"Client {session_id} disconnected")
+        print("Client disconnected")
 
 
 @app.websocket("/ws/voice")
 async def websocket_voice_endpoint(websocket: WebSocket):
     """WebSocket endpoint for voice-based interaction with streaming audio-text sync."""
     await websocket.accept()
-    session_id = str(id(websocket))
-    conversations[session_id] = []
+    # History lives on the connection coroutine itself: no keyed lookups,
+    # and it's reclaimed automatically however the handler exits. Stored as
+    # (role, content) tuples, materialized into dicts at the Runner boundary.
+    history: deque = deque(maxlen=MAX_HISTORY_MESSAGES)
+    # Server-side response chain; see websocket_text_endpoint
+    last_response_id: str | None = None
+    # Text frames that arrived while the agent was speaking, replayed
+    # ahead of the socket on the next loop iteration
+    pending_frames: deque = deque()
 
     try:
-        # Send welcome message with streaming
-        welcome = "Welcome to ProVia Doors! I'm ready to help you find the perfect door."
-        await stream_response_with_audio(websocket, welcome)
+        # Send welcome message with streaming, reusing the startup audio
+        await stream_response_with_audio(
+            websocket,
+            WELCOME_SPEECH,
+            precomputed_audio=websocket.app.state.welcome_audio,
+        )
 
         while True:
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
+            data = pending_frames.popleft() if pending_frames else await websocket.receive_text()
+            message_data = orjson.loads(data)
 
             msg_type = message_data.get("type", "text")
             content = message_data.get("content", "")
@@ -141,120 +247,361 @@ async def websocket_voice_endpoint(websocket: WebSocket):
             if not content.strip():
                 continue
 
-            # Add to conversation history
-            conversations[session_id].append({
-                "role": "user",
-                "content": content
-            })
+            # Add to conversation history, keeping the tail
+            history.append(("user", content))
+            _trim_history(history)
 
             # Send processing indicator
-            await websocket.send_json({"type": "processing", "content": True})
+            await _send_json(websocket, {"type": "processing", "content": True})
 
             try:
-                # Run the agent
-                result = await Runner.run(
-                    provia_agent,
-                    input=conversations[session_id],
+                # Stream the agent run, speaking each sentence as soon as
+                # its boundary appears instead of waiting for the full
+                # response before the first TTS call
+                if last_response_id is not None:
+                    run_input = [{"role": "user", "content": content}]
+                else:
+                    run_input = [
+                        {"role": role, "content": content}
+                        for role, content in history
+                    ]
+                stream_task = asyncio.create_task(
+                    stream_agent_response_with_audio(
+                        websocket,
+                        run_input,
+                        previous_response_id=last_response_id,
+                    )
                 )
-
-                response_content = result.final_output
+                # Race the run against a disconnect watcher: if the user
+                # navigates away mid-response, synthesis is cancelled
+                # instead of burning TTS calls until a send fails
+                watcher = asyncio.create_task(
+                    _watch_disconnect(websocket, pending_frames)
+                )
+                try:
+                    done, _ = await asyncio.wait(
+                        {stream_task, watcher},
+                        timeout=AGENT_TIMEOUT_S,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if watcher in done:
+                        raise WebSocketDisconnect()
+                    if stream_task not in done:
+                        raise TimeoutError("agent run timed out")
+                    response_content, last_response_id = stream_task.result()
+                finally:
+                    stream_task.cancel()
+                    watcher.cancel()
 
                 # Add to history
-                conversations[session_id].append({
-                    "role": "assistant",
-                    "content": response_content
-                })
-
-                # Stream response with synchronized audio
-                await stream_response_with_audio(websocket, response_content)
+                history.append(("assistant", response_content))
 
+            except WebSocketDisconnect:
+                raise
             except Exception as e:
-                await websocket.send_json({
+                # Drop the chain; the next turn resends the local history
+                last_response_id = None
+                await _send_json(websocket, {
                     "type": "error",
                     "content": f"Sorry, I encountered an error: {str(e)}"
                 })
 
-            await websocket.send_json({"type": "processing", "content": False})
+            await _send_json(websocket, {"type": "processing", "content": False})
 
     except WebSocketDisconnect:
-        if session_id in conversations:
-            del conversations[session_id]
-        print(f"Voice client {session_id} disconnected")
+        print("Voice client disconnected")
 
 
-async def stream_response_with_audio(websocket: WebSocket, text: str):
-    """Stream text word-by-word with synchronized TTS audio chunks."""
+REALTIME_URL = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview"
 
-    # Clean text for TTS
-    clean_text = text.replace("**", "").replace("*", "").replace("#", "").replace("`", "")
 
-    # Signal start of streaming response
-    await websocket.send_json({
+@app.websocket("/ws/realtime")
+async def websocket_realtime_endpoint(websocket: WebSocket):
+    """Proxy raw browser audio to the OpenAI Realtime API.
+
+    Binary frames from the browser are forwarded upstream as
+    input_audio_buffer.append events and audio deltas stream back as
+    binary frames, so the assistant starts speaking mid-generation
+    without the STT -> text agent -> TTS round trip of /ws/voice.
+    """
+    await websocket.accept()
+
+    headers = {
+        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY', '')}",
+        "OpenAI-Beta": "realtime=v1",
+    }
+    try:
+        async with websockets.connect(REALTIME_URL, additional_headers=headers) as upstream:
+            # Give the realtime session the same persona as the text agent
+            await upstream.send(orjson.dumps({
+                "type": "session.update",
+                "session": {
+                    "instructions": provia_agent.instructions,
+                    "voice": "alloy",
+                },
+            }).decode())
+
+            # The realtime protocol mandates base64 payloads; run the
+            # conversions in the executor so multi-KB frames don't stall
+            # the event loop for other connections
+            loop = asyncio.get_running_loop()
+
+            async def browser_to_upstream():
+                while True:
+                    frame = await websocket.receive_bytes()
+                    audio = await loop.run_in_executor(None, base64.b64encode, frame)
+                    await upstream.send(orjson.dumps({
+                        "type": "input_audio_buffer.append",
+                        "audio": audio.decode(),
+                    }).decode())
+
+            async def upstream_to_browser():
+                async for raw in upstream:
+                    event = orjson.loads(raw)
+                    if event.get("type") == "response.audio.delta":
+                        audio = await loop.run_in_executor(
+                            None, base64.b64decode, event["audio"]
+                        )
+                        await websocket.send_bytes(audio)
+
+            _, pending = await asyncio.wait(
+                [
+                    asyncio.create_task(browser_to_upstream()),
+                    asyncio.create_task(upstream_to_browser()),
+                ],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in pending:
+                task.cancel()
+
+    except WebSocketDisconnect:
+        print("Realtime client disconnected")
+
+
+def _clean_speech(text: str) -> str:
+    """Strip markdown markers that shouldn't be spoken."""
+    return text.translate(_TTS_STRIP)
+
+
+def _split_sentences(text: str):
+    """Yield sentences of already-complete text in one left-to-right scan.
+
+    A sentence ends at .!? followed by whitespace. Yielding as each
+    boundary is found lets the caller kick off TTS for the first
+    sentence before the rest of the text has even been scanned.
+    """
+    start = 0
+    i = 0
+    n = len(text)
+    while i < n:
+        if text[i] in ".!?" and i + 1 < n and text[i + 1].isspace():
+            yield text[start:i + 1]
+            i += 1
+            while i < n and text[i].isspace():
+                i += 1
+            start = i
+        else:
+            i += 1
+    tail = text[start:]
+    if tail.strip():
+        yield tail
+
+
+async def _watch_disconnect(websocket: WebSocket, pending: deque) -> None:
+    """Return once the client goes away.
+
+    Run alongside a streaming task so a mid-response disconnect is
+    noticed immediately instead of on the next failed send. Text frames
+    arriving while the agent is speaking are buffered into `pending` so
+    the main loop handles them once the stream finishes, just as the
+    plain receive loop would have.
+    """
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        text = message.get("text")
+        if text is not None:
+            pending.append(text)
+
+
+async def _fetch_tts_chunks(sentence: str, chunks: asyncio.Queue):
+    """Stream TTS bytes for one sentence into a queue; None marks the end."""
+    try:
+        async with client.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice="alloy",
+            input=sentence,
+            response_format="opus"
+        ) as response:
+            async for chunk in response.iter_bytes(4096):
+                chunks.put_nowait(chunk)
+    except Exception as e:
+        print(f"TTS Error: {e}")
+    finally:
+        chunks.put_nowait(None)
+
+
+def _start_tts(sentence: str) -> asyncio.Queue:
+    """Kick off the TTS fetch for a sentence and return its chunk queue.
+
+    Fetches for later sentences run while earlier ones are still being
+    delivered, so total audio latency tracks the slowest request instead
+    of the sum of all of them.
+    """
+    chunks: asyncio.Queue = asyncio.Queue()
+    asyncio.create_task(_fetch_tts_chunks(sentence, chunks))
+    return chunks
+
+
+async def _stream_sentence_audio(websocket: WebSocket, sentence: str, chunks: asyncio.Queue):
+    """Send one sentence's words plus its already-fetching TTS audio."""
+
+    words = sentence.split()
+
+    # Calculate approximate timing per word
+    # Average speaking rate is ~150 words per minute = 400ms per word
+    word_duration_ms = 350
+
+    got_audio = False
+    while (chunk := await chunks.get()) is not None:
+        got_audio = True
+        # Raw tagged bytes: no base64 inflation or encode/decode CPU
+        await websocket.send_bytes(_AUDIO_TAG + chunk)
+
+    # Sentinel: the client assembles the chunks received since the last
+    # sentinel into this sentence's audio. Carrying the word timings here
+    # (playback starts on this frame anyway) merges what used to be two
+    # frames into one. A failed fetch sends no audio, matching the old
+    # words-only fallback.
+    if got_audio:
+        await _send_json(websocket, {
+            "type": "stream_audio_end",
+            "format": "opus",
+            "words": [
+                {
+                    "word": word + (" " if i < len(words) - 1 else ""),
+                    "index": i,
+                    "delay": word_duration_ms
+                }
+                for i, word in enumerate(words)
+            ]
+        })
+
+
+async def _speak_sentences(websocket: WebSocket, queue: asyncio.Queue):
+    """Deliver queued (sentence, chunks) pairs in FIFO order; None stops."""
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+        sentence, chunks = item
+        await _stream_sentence_audio(websocket, sentence, chunks)
+
+
+async def stream_agent_response_with_audio(
+    websocket: WebSocket,
+    conversation: list[dict],
+    previous_response_id: str | None = None,
+) -> tuple[str, str | None]:
+    """Run the agent streamed and speak sentences as they complete.
+
+    Deltas accumulate in a buffer; every completed sentence is handed to a
+    speaker task over a queue, so TTS for the first sentence overlaps the
+    rest of the generation and time-to-first-audio drops from
+    (full LLM + TTS) to (first sentence + TTS). Returns the final output
+    and the response id to chain the next run onto.
+    """
+    await _send_json(websocket, {
         "type": "stream_start",
         "content": ""
     })
 
-    # Split into sentences for better audio chunking
-    import re
-    sentences = re.split(r'(?<=[.!?])\s+', clean_text)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_SPEAK_QUEUE_MAX)
+    speaker = asyncio.create_task(_speak_sentences(websocket, queue))
 
-    for sentence in sentences:
-        if not sentence.strip():
-            continue
+    buffer = ""
+    pos = 0   # start of the first unqueued sentence
+    scan = 0  # next index to examine for a boundary
+    try:
+        result = Runner.run_streamed(
+            provia_agent,
+            input=conversation,
+            previous_response_id=previous_response_id,
+        )
+        async for event in result.stream_events():
+            if event.type == "raw_response_event" and isinstance(
+                event.data, ResponseTextDeltaEvent
+            ):
+                buffer += event.data.delta
+                # Queue each newly completed sentence, using the same
+                # boundary rule as _split_sentences: a terminator counts
+                # only once whitespace follows it, so "$3,499.99" or
+                # "Mr." never splits, and one at the buffer end waits for
+                # the next delta. put blocks when the queue is full, so
+                # TTS for further sentences isn't kicked off until the
+                # speaker catches up.
+                while scan < len(buffer):
+                    if buffer[scan] in ".!?":
+                        if scan + 1 == len(buffer):
+                            break
+                        if buffer[scan + 1].isspace():
+                            sentence = _clean_speech(buffer[pos:scan + 1]).strip()
+                            if sentence:
+                                await queue.put((sentence, _start_tts(sentence)))
+                            pos = scan + 1
+                    scan += 1
+
+        # Whatever is left is the final (possibly unterminated) sentence
+        tail = _clean_speech(buffer[pos:]).strip()
+        if tail:
+            await queue.put((tail, _start_tts(tail)))
+    finally:
+        await queue.put(None)
+        await speaker
+
+    full_text = result.final_output
 
-        # Split sentence into words
-        words = sentence.split()
+    # Signal end of streaming
+    await _send_json(websocket, {
+        "type": "stream_end",
+        "fullText": full_text
+    })
+    return full_text, result.last_response_id
 
-        try:
-            # Generate TTS audio for this sentence
-            response = await client.audio.speech.create(
-                model="tts-1",
-                voice="alloy",
-                input=sentence,
-                response_format="mp3"
-            )
 
-            # Get audio data
-            audio_data = response.content
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+async def stream_response_with_audio(websocket: WebSocket, text: str, precomputed_audio: bytes | None = None):
+    """Stream known text word-by-word with synchronized TTS audio.
 
-            # Calculate approximate timing per word
-            # Average speaking rate is ~150 words per minute = 400ms per word
-            word_duration_ms = 350
+    precomputed_audio short-circuits synthesis with already-cached MP3
+    bytes (e.g. the welcome line fetched at startup).
+    """
 
-            # Send words with timing info
-            for i, word in enumerate(words):
-                await websocket.send_json({
-                    "type": "stream_word",
-                    "word": word + (" " if i < len(words) - 1 else ""),
-                    "index": i,
-                    "delay": word_duration_ms
-                })
+    clean_text = _clean_speech(text)
 
-            # Send audio chunk for this sentence
-            await websocket.send_json({
-                "type": "stream_audio",
-                "audio": audio_base64,
-                "format": "mp3",
-                "wordCount": len(words)
-            })
-
-            # Small delay between sentences
-            await asyncio.sleep(0.1)
-
-        except Exception as e:
-            print(f"TTS Error: {e}")
-            # Fallback: just send words without audio
-            for i, word in enumerate(words):
-                await websocket.send_json({
-                    "type": "stream_word",
-                    "word": word + (" " if i < len(words) - 1 else ""),
-                    "index": i,
-                    "delay": 100
-                })
+    # Signal start of streaming response
+    await _send_json(websocket, {
+        "type": "stream_start",
+        "content": ""
+    })
+
+    if precomputed_audio is not None:
+        # Replay the cached audio as one sentence, chunked like a live fetch
+        chunks: asyncio.Queue = asyncio.Queue()
+        for i in range(0, len(precomputed_audio), 4096):
+            chunks.put_nowait(precomputed_audio[i:i + 4096])
+        chunks.put_nowait(None)
+        await _stream_sentence_audio(websocket, clean_text, chunks)
+    else:
+        # Split into sentences and start every TTS fetch up front so the
+        # network waits overlap; delivery below stays in order
+        fetches = [(s, _start_tts(s)) for s in _split_sentences(clean_text)]
+
+        for sentence, chunks in fetches:
+            await _stream_sentence_audio(websocket, sentence, chunks)
 
     # Signal end of streaming
-    await websocket.send_json({
+    await _send_json(websocket, {
         "type": "stream_end",
         "fullText": text
     })
@@ -282,4 +629,20 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools cut event-loop and HTTP parsing overhead, and one
+    # worker per core sidesteps the GIL under concurrent connections.
+    # Session state is per-connection and a websocket sticks to the worker
+    # that accepted it, so in-process history stays correct.
+    # permessage-deflate is off because the bulk of the traffic here is
+    # opus audio, which is already compressed: deflating it burns CPU per
+    # frame for near-zero ratio gain, and the JSON frames are small.
+    uvicorn.run(
+        "voice_server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        ws_per_message_deflate=False,
+        workers=os.cpu_count(),
+    )